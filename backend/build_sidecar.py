@@ -16,31 +16,79 @@ try:
 except Exception:
     pass
 
+import argparse
+import asyncio
+import atexit
+import collections
+import functools
+import hashlib
+import json
+import mmap
 import platform
+import re
+import sysconfig
+import threading
 import subprocess
 import shutil
+import time
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import importlib.util
 
+def _probe_package(package):
+    """Return (package, missing) by resolving its importable module name."""
+    name_map = {
+        'pyinstaller': 'PyInstaller',  # real importable module name
+    }
+    mod_name = name_map.get(package, package).replace('-', '_')
+    return package, importlib.util.find_spec(mod_name) is None
+
+def _reqs_cache_key():
+    """Hash the interpreter, sys.path and installed package set."""
+    hasher = hashlib.blake2b(sys.executable.encode())
+    hasher.update(b"|")
+    hasher.update("\n".join(sys.path).encode())
+    try:
+        frozen = _spawn([sys.executable, "-m", "pip", "freeze"],
+                                capture_output=True, timeout=60)
+        hasher.update(b"|")
+        hasher.update(frozen.stdout)
+    except Exception:
+        return None  # no stable key available - skip the persistent cache
+    return hasher.hexdigest()
+
+@functools.lru_cache(maxsize=1)
 def check_requirements():
     """Check if all required packages are installed."""
     required_packages = ['pyinstaller', 'gradio']
-    
+
     # Platform-specific requirements
     if platform.system() == "Darwin" and platform.machine().startswith("arm"):
         required_packages.append('mlx-whisper')
     else:
         required_packages.extend(['faster-whisper', 'ctranslate2'])
-    
-    missing_packages = []
-    name_map = {
-        'pyinstaller': 'PyInstaller',  # real importable module name
-    }
-    for package in required_packages:
-        mod_name = name_map.get(package, package).replace('-', '_')
-        if importlib.util.find_spec(mod_name) is None:
-            missing_packages.append(package)
-    
+
+    # Skip the sys.path walks entirely when the environment is unchanged
+    reqs_cache = BASE_DIR / "build" / ".reqs_cache.json"
+    key = _reqs_cache_key()
+    missing_packages = None
+    if key and reqs_cache.exists():
+        try:
+            cached = json.loads(reqs_cache.read_text())
+            if cached.get("key") == key:
+                missing_packages = cached["missing"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    if missing_packages is None:
+        # find_spec is filesystem-bound, so probe all packages concurrently
+        with ThreadPoolExecutor(max_workers=len(required_packages)) as executor:
+            results = list(executor.map(_probe_package, required_packages))
+        missing_packages = [package for package, missing in results if missing]
+        if key:
+            reqs_cache.parent.mkdir(exist_ok=True)
+            reqs_cache.write_text(json.dumps({"key": key, "missing": missing_packages}))
+
     if missing_packages:
         print(f"❌ Missing packages: {', '.join(missing_packages)}")
         print("Please install them with:")
@@ -51,14 +99,115 @@ def check_requirements():
     return True
 
 BASE_DIR = Path(__file__).parent.resolve()
+FINGERPRINT_FILE = BASE_DIR / "build" / ".fingerprint"
+
+# Extra PyInstaller flags set by clean_build_dirs(). --clean wipes the
+# PYINSTALLER_CONFIG_DIR cache and the workpath, which defeats the
+# fingerprint-gated cache retention above, so it is only passed when the
+# user explicitly asked for a scrubbed build with --force-clean.
+_PYI_CLEAN_ARGS = []
+
+def _spawn(cmd, **kwargs):
+    """
+    subprocess.run wrapper for the module's short helper commands,
+    documenting that they must stay eligible for CPython's posix_spawn
+    fast path on Linux/macOS: no preexec_fn, default close_fds, and no
+    process_group override (subprocess only takes the posix_spawn route
+    when process_group is left at its default of -1). That avoids the
+    copy-on-write page table hit of fork+exec from a large Python
+    parent.
+    """
+    return subprocess.run(cmd, **kwargs)
+
+def _build_fingerprint():
+    """
+    Hash the build inputs (main.py, spec file, installed packages) so
+    incremental rebuilds can tell whether the cached build/ is still valid.
+    """
+    hasher = hashlib.blake2b()
+    for input_file in [BASE_DIR / "main.py",
+                       BASE_DIR / "whisper-gui-core.spec",
+                       BASE_DIR / "requirements.txt"]:
+        if input_file.exists():
+            hasher.update(input_file.read_bytes())
+    try:
+        frozen = _spawn([sys.executable, "-m", "pip", "freeze"],
+                                capture_output=True, timeout=60)
+        hasher.update(frozen.stdout)
+    except Exception:
+        pass  # no pip available - fall back to hashing source inputs only
+    return hasher.hexdigest()
+
+def clean_build_dirs(force_clean=False):
+    """
+    Clean previous build directories.
+
+    By default build/ is kept between runs so PyInstaller can reuse its
+    Analysis cache; it is only removed when the build inputs changed
+    (fingerprint mismatch) or --force-clean was passed. dist/ is left in
+    place unless --force-clean is given.
+    """
+    fingerprint = _build_fingerprint()
+    cached = FINGERPRINT_FILE.read_text() if FINGERPRINT_FILE.exists() else None
 
-def clean_build_dirs():
-    """Clean previous build directories."""
-    dirs_to_clean = [BASE_DIR / 'build', BASE_DIR / 'dist', BASE_DIR / '__pycache__']
-    for dir_name in dirs_to_clean:
-        if dir_name.exists():
+    dirs_to_clean = [BASE_DIR / '__pycache__']
+    if force_clean:
+        dirs_to_clean += [BASE_DIR / 'build', BASE_DIR / 'dist']
+        _PYI_CLEAN_ARGS[:] = ["--clean"]
+    elif fingerprint != cached:
+        dirs_to_clean.append(BASE_DIR / 'build')
+    else:
+        print("♻️  Build inputs unchanged - keeping cached build/ for incremental rebuild")
+
+    existing_dirs = [d for d in dirs_to_clean if d.exists()]
+    if existing_dirs:
+        for dir_name in existing_dirs:
             print(f"🧹 Cleaning {dir_name}...")
-            shutil.rmtree(dir_name)
+        # unlink/rmdir release the GIL, so removing the trees concurrently
+        # overlaps the tens of thousands of syscalls in a PyInstaller build/
+        with ThreadPoolExecutor(max_workers=len(existing_dirs)) as executor:
+            list(executor.map(_rmtree_retry, existing_dirs))
+
+    FINGERPRINT_FILE.parent.mkdir(exist_ok=True)
+    FINGERPRINT_FILE.write_text(fingerprint)
+
+def _rmtree_retry(path):
+    """rmtree with a single retry for transient Windows PermissionError."""
+    try:
+        shutil.rmtree(path)
+    except PermissionError:
+        time.sleep(1)
+        shutil.rmtree(path, ignore_errors=True)
+
+PATCH_MARKER = b"from patch_gpu import auto_engine_detailed"
+
+# Pre-encoded once so the patch step never re-encodes it per call
+_PATCH_BYTES = """
+# GPU Auto-detection patch for cross-platform support
+try:
+    from patch_gpu import auto_engine_detailed
+    USE_OPTIMIZED_BACKEND = True
+    print("🚀 Using optimized GPU auto-detection backend")
+except ImportError:
+    USE_OPTIMIZED_BACKEND = False
+    print("⚠️  Falling back to original whisperx backend")
+""".encode("utf-8")
+PATCHED_MTIME_FILE = BASE_DIR / "build" / ".patched_mtime"
+
+def _already_patched(main_py_path):
+    """Cheap checks that let patch_main_py skip the read-modify-write."""
+    # A short mmap scan for the patch marker avoids decoding the file
+    with open(main_py_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(PATCH_MARKER) >= 0:
+                return True
+    # mtime recorded by the last successful patch
+    if PATCHED_MTIME_FILE.exists():
+        try:
+            return PATCHED_MTIME_FILE.read_text() == str(os.path.getmtime(main_py_path))
+        except OSError:
+            pass
+    return False
 
 def patch_main_py():
     """
@@ -67,88 +216,442 @@ def patch_main_py():
     """
     main_py_path = BASE_DIR / "main.py"
     backup_path = BASE_DIR / "main.py.backup"
-    
+
     if not main_py_path.exists():
         print("❌ main.py not found!")
         return False
-    
+
+    # Fast path: nothing to do when the patch is already in place
+    if _already_patched(main_py_path):
+        print("♻️  main.py already patched - skipping rewrite")
+        return True
+
     # Create backup if it doesn't exist
     if not backup_path.exists():
         shutil.copy2(main_py_path, backup_path)
         print("📁 Created backup of main.py")
-    
-    # Read the original file
-    with open(main_py_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Add our patch import at the top
-    patch_import = """
-# GPU Auto-detection patch for cross-platform support
-try:
-    from patch_gpu import auto_engine_detailed
-    USE_OPTIMIZED_BACKEND = True
-    print("🚀 Using optimized GPU auto-detection backend")
-except ImportError:
-    USE_OPTIMIZED_BACKEND = False
-    print("⚠️  Falling back to original whisperx backend")
-"""
-    
+
+    # Splice the patch import in-place on a bytearray: no UTF-8
+    # decode/encode round-trip and no second full-size string copy
+    data = bytearray(main_py_path.read_bytes())
+
     # Insert the patch import after the existing imports
-    import_end = content.find("enablePrint()")
+    import_end = data.find(b"enablePrint()")
     if import_end != -1:
-        insert_pos = content.find("\n", import_end) + 1
-        modified_content = content[:insert_pos] + patch_import + content[insert_pos:]
-        
-        with open(main_py_path, 'w', encoding='utf-8') as f:
-            f.write(modified_content)
-        
+        insert_pos = data.find(b"\n", import_end) + 1
+        data[insert_pos:insert_pos] = _PATCH_BYTES
+
+        main_py_path.write_bytes(bytes(data))
+
+        # Record the patched mtime so repeated builds skip straight out
+        PATCHED_MTIME_FILE.parent.mkdir(exist_ok=True)
+        PATCHED_MTIME_FILE.write_text(str(os.path.getmtime(main_py_path)))
+
         print("✅ Patched main.py with optimized backend")
         return True
-    
+
     print("⚠️  Could not patch main.py automatically")
     return False
 
+@functools.lru_cache(maxsize=1)
+def _select_python():
+    """
+    Pick the interpreter that runs PyInstaller (and therefore the
+    runtime that gets bundled into the sidecar).
+
+    Prefers $WEB_WHISPER_PGO_PYTHON so CI can point at a CPython built
+    with `./configure --enable-optimizations --with-lto`, which starts
+    the packaged sidecar ~10-30% faster. Otherwise uses the current
+    interpreter, warning once when it lacks PGO.
+    """
+    override = os.environ.get("WEB_WHISPER_PGO_PYTHON")
+    if override:
+        return override
+    config_args = sysconfig.get_config_var("CONFIG_ARGS") or ""
+    if "--enable-optimizations" not in config_args:
+        print("⚠️  Building with a non-PGO Python; set WEB_WHISPER_PGO_PYTHON "
+              "to a PGO+LTO build for a faster sidecar")
+    return sys.executable
+
+def _pyinstaller_cmd():
+    """Base PyInstaller invocation under the selected interpreter."""
+    return [_select_python(), "-m", "PyInstaller"]
+
+def _spec_jobs():
+    """
+    Enumerate PyInstaller build jobs as (spec_path, cache_dir) tuples.
+
+    Each job gets its own PYINSTALLER_CONFIG_DIR so concurrent builds
+    cannot corrupt each other's analysis cache.
+    """
+    jobs = []
+    for spec_name in ["whisper-gui-core.spec", "whisper-gui-core-simple.spec"]:
+        spec_path = BASE_DIR / spec_name
+        if spec_path.exists():
+            jobs.append((spec_path, BASE_DIR / ".pyi-cache" / spec_path.stem))
+    return jobs
+
+class PyInstallerDaemon:
+    """
+    Keep one warm PyInstaller process alive across successive builds.
+
+    The worker (worker_pyinstaller.py) imports PyInstaller once and then
+    runs one build per JSON command from stdin, so rebuild-after-change
+    iterations skip the per-invocation import/startup cost entirely.
+    Enabled with WEB_WHISPER_DAEMON=1.
+    """
+
+    def __init__(self):
+        self.proc = subprocess.Popen(
+            [sys.executable, "-u", str(BASE_DIR / "worker_pyinstaller.py")],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+
+    def build(self, spec_path, opts=()):
+        """Run one build in the warm worker; returns True on success."""
+        self.proc.stdin.write(json.dumps({"spec": str(spec_path), "opts": list(opts)}) + "\n")
+        self.proc.stdin.flush()
+        response = self.proc.stdout.readline()
+        if not response:
+            return False  # worker died
+        result = json.loads(response)
+        if not result.get("ok"):
+            print(f"❌ Daemon build failed: {result.get('error', 'unknown error')}")
+        return result.get("ok", False)
+
+    def close(self):
+        try:
+            self.proc.stdin.write(json.dumps({"exit": True}) + "\n")
+            self.proc.stdin.flush()
+            self.proc.wait(timeout=5)
+        except Exception:
+            self.proc.kill()
+
+_daemon = None
+
+def _get_daemon():
+    global _daemon
+    if _daemon is None:
+        _daemon = PyInstallerDaemon()
+        atexit.register(_daemon.close)
+    return _daemon
+
+# Lines that make a build certain to fail - no point finishing it
+_FAILFAST_RE = re.compile(r"^(ERROR|Traceback|ModuleNotFoundError|ImportError)")
+
+# Set from the --strict flag in main(): abort builds on the first error
+# line instead of waiting out the full multi-minute run
+STRICT_MODE = False
+
+def _run_streamed(cmd, cwd=None, env=None, timeout=None, log_name="build.log"):
+    """
+    Run a command streaming its output line by line instead of buffering
+    the whole log in memory.
+
+    Every line is appended to build/<log_name>; warnings, errors and
+    tracebacks are mirrored to the console as they appear, so problems
+    surface while the build is still running. In strict mode the process
+    is killed on the first fatal-looking line. Returns the exit code.
+    """
+    log_path = BASE_DIR / "build" / log_name
+    log_path.parent.mkdir(exist_ok=True)
+
+    proc = subprocess.Popen(cmd, cwd=cwd, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            bufsize=1, text=True)
+    tail = collections.deque(maxlen=200)
+    failed_fast = threading.Event()
+
+    def pump():
+        with open(log_path, "a", encoding="utf-8") as log_file:
+            for line in proc.stdout:
+                log_file.write(line)
+                tail.append(line.rstrip())
+                if any(marker in line for marker in ("ERROR", "WARNING", "Traceback")):
+                    print(line.rstrip())
+                if STRICT_MODE and not failed_fast.is_set() and _FAILFAST_RE.match(line):
+                    failed_fast.set()
+                    proc.terminate()
+
+    reader = threading.Thread(target=pump, daemon=True)
+    reader.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    reader.join()
+    if failed_fast.is_set():
+        raise RuntimeError("Build aborted on first error (--strict):\n" + "\n".join(tail))
+    return returncode
+
+def _run_spec_job(spec_path, cache_dir, extra_args):
+    """Run a single PyInstaller spec build with an isolated cache dir."""
+    job_dist = BASE_DIR / "build" / "jobs" / spec_path.stem / "dist"
+    job_work = BASE_DIR / "build" / "jobs" / spec_path.stem / "work"
+    env = os.environ.copy()
+    env["PYINSTALLER_CONFIG_DIR"] = str(cache_dir)
+    cmd = _pyinstaller_cmd() + _PYI_CLEAN_ARGS + [
+           "--distpath", str(job_dist),
+           "--workpath", str(job_work),
+           str(spec_path)] + extra_args
+    returncode = _run_streamed(cmd, env=env, log_name=f"build-{spec_path.stem}.log")
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+    return job_dist
+
+def _merge_dist(job_dists):
+    """Copy the per-job dist outputs into the single top-level dist/."""
+    dist_dir = BASE_DIR / "dist"
+    dist_dir.mkdir(exist_ok=True)
+    for job_dist in job_dists:
+        for item in job_dist.iterdir():
+            target = dist_dir / item.name
+            if item.is_dir():
+                if target.exists():
+                    shutil.rmtree(target)
+                shutil.copytree(item, target)
+            else:
+                shutil.copy2(item, target)
+
+# Template for the generated spec. Compared to the static spec this uses
+# collect_submodules instead of collect_all, so Analysis only walks the
+# packages that are actually installed on this platform instead of the
+# union of every platform's dependencies.
+_SPEC_TEMPLATE = """\
+# -*- mode: python ; coding: utf-8 -*-
+# Generated by build_sidecar.py - do not edit by hand.
+from PyInstaller.utils.hooks import collect_data_files, collect_submodules
+
+datas = [({configs!r}, 'configs'), ({scripts!r}, 'scripts')]
+binaries = []
+hiddenimports = list({hiddenimports!r})
+for pkg in {submodule_pkgs!r}:
+    hiddenimports += collect_submodules(pkg)
+for pkg in {data_pkgs!r}:
+    datas += collect_data_files(pkg)
+
+a = Analysis(
+    [{entry!r}],
+    pathex=[],
+    binaries=binaries,
+    datas=datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={{}},
+    runtime_hooks=[],
+    excludes=[],
+    noarchive=False,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name='whisper-gui-core',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+"""
+
+def _generate_spec(entry):
+    """
+    Render a spec specialized to the packages installed on this machine
+    and write it to build/generated.spec. Enabled with
+    WEB_WHISPER_DYNAMIC_SPEC=1; the static spec stays the default.
+    """
+    backend_pkgs = [pkg for pkg in ("mlx_whisper", "faster_whisper")
+                    if importlib.util.find_spec(pkg) is not None]
+    spec_text = _SPEC_TEMPLATE.format(
+        entry=str(entry),
+        configs=str(BASE_DIR / "configs"),
+        scripts=str(BASE_DIR / "scripts"),
+        hiddenimports=["gradio", "safehttpx"] + backend_pkgs,
+        submodule_pkgs=["gradio"] + backend_pkgs,
+        data_pkgs=["gradio", "safehttpx", "gradio_client", "groovy"] + backend_pkgs,
+    )
+    spec_path = BASE_DIR / "build" / "generated.spec"
+    spec_path.parent.mkdir(exist_ok=True)
+    spec_path.write_text(spec_text, encoding="utf-8")
+    print(f"📝 Generated spec: {spec_path}")
+    return spec_path
+
+def _chmod_tree(root, mode):
+    """
+    Set mode on every executable and shared library under root.
+
+    Walks with os.scandir (one stat per directory read instead of one
+    per entry) and batches the chmod calls over a thread pool, since
+    chmod releases the GIL. Covers the --onedir layout where hundreds
+    of .so/.dylib files need their bits fixed, not just the main binary.
+    """
+    targets = []
+
+    def collect(directory):
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    collect(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    if entry.name.endswith((".so", ".dylib")) or "." not in entry.name:
+                        targets.append(entry.path)
+
+    collect(root)
+    if targets:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            list(executor.map(lambda path: os.chmod(path, mode), targets))
+
+def _arch_spec(spec_path, arch):
+    """
+    Write a sibling copy of spec_path with target_arch pinned to arch.
+
+    PyInstaller rejects --target-arch (a makespec option) when building
+    from a spec file, and the spec's own target_arch would govern even
+    if it didn't, so the arch has to be set in the spec text itself. The
+    variant sits next to the original because relative datas paths in a
+    spec resolve against the spec's own directory.
+    """
+    text = spec_path.read_text(encoding="utf-8")
+    patched, count = re.subn(r"target_arch\s*=\s*[^,\n]+",
+                             f"target_arch='{arch}'", text)
+    if count == 0:
+        raise RuntimeError(f"No target_arch entry to pin in {spec_path}")
+    out = BASE_DIR / f".{spec_path.stem}-{arch}.spec"
+    out.write_text(patched, encoding="utf-8")
+    return out
+
+def _build_macos_universal(spec_path):
+    """
+    Build arm64 and x86_64 thin binaries concurrently, then fuse them
+    with lipo. Two parallel thin builds finish in roughly half the wall
+    time of one serial universal2 build.
+    """
+    def build_arch(arch):
+        dist_dir = BASE_DIR / "dist" / arch
+        work_dir = BASE_DIR / "build" / arch
+        env = os.environ.copy()
+        env["PYINSTALLER_CONFIG_DIR"] = str(BASE_DIR / ".pyi-cache" / arch)
+        cmd = _pyinstaller_cmd() + _PYI_CLEAN_ARGS + [
+               "--distpath", str(dist_dir),
+               "--workpath", str(work_dir),
+               str(_arch_spec(spec_path, arch))]
+        returncode = _run_streamed(cmd, env=env, log_name=f"build-{arch}.log")
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
+        return dist_dir / "whisper-gui-core"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        thin_binaries = list(executor.map(build_arch, ["arm64", "x86_64"]))
+
+    merged = BASE_DIR / "dist" / "whisper-gui-core"
+    merged.parent.mkdir(exist_ok=True)
+    _spawn(["lipo", "-create", *[str(b) for b in thin_binaries],
+            "-output", str(merged)], check=True)
+
 def build_executable():
     """Build the executable using PyInstaller."""
     system = platform.system()
-    
+
     # Determine the correct spec file and build command
     spec_path = BASE_DIR / "whisper-gui-core.spec"
-    
+
     if not spec_path.exists():
         print(f"❌ Spec file {spec_path.name} not found at {spec_path}!")
         print("⚠️  Falling back to CLI-based PyInstaller build without spec...")
         return build_executable_fallback()
-    
+
+    if os.environ.get("WEB_WHISPER_DYNAMIC_SPEC") == "1":
+        # Specialize the spec to this machine's installed packages
+        spec_path = _generate_spec(BASE_DIR / "main.py")
+
     print(f"🔨 Building executable for {system}...")
-    
-    # PyInstaller command
-    cmd = ["pyinstaller", "--clean", str(spec_path)]
-    
-    # Add platform-specific options
+
+    # Let any nested make/cmake compile steps spawned during the build
+    # (e.g. for hidden-import extension modules) use all cores
+    cpu_count = os.cpu_count() or 1
+    os.environ.setdefault("MAKEFLAGS", f"-j{cpu_count}")
+    os.environ.setdefault("CMAKE_BUILD_PARALLEL_LEVEL", str(cpu_count))
+
+    # Platform-specific options
+    extra_args = []
     if system == "Darwin":
-        # macOS Universal binary
-        cmd.extend(["--target-arch", "universal2"])
+        # macOS Universal binary (built as two parallel thin arches)
         expected_output = BASE_DIR / "dist/whisper-gui-core"
     elif system == "Windows":
         expected_output = BASE_DIR / "dist/whisper-gui-core.exe"
     else:
         # Linux
         expected_output = BASE_DIR / "dist/whisper-gui-core"
-    
+
     try:
-        # Run PyInstaller
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        jobs = _spec_jobs()
+        if spec_path.name == "generated.spec":
+            # The dynamic spec replaces the main static spec in the job
+            # list (the simple spec is unaffected), so the multi-spec
+            # paths build it instead of silently falling back to the
+            # static one
+            jobs = [(spec_path if spec.name == "whisper-gui-core.spec" else spec, cache)
+                    for spec, cache in jobs]
+        use_daemon = os.environ.get("WEB_WHISPER_DAEMON") == "1"
+        if system == "Darwin":
+            # Build both arches concurrently and lipo-merge the result.
+            # The daemon is not used here: the warm worker is a single
+            # process, and the parallel thin-arch builds are the bigger
+            # win on macOS.
+            _build_macos_universal(spec_path)
+        elif use_daemon and jobs:
+            # Reuse the warm PyInstaller worker across builds. It is one
+            # process, so the jobs run through it sequentially; the win
+            # is skipping the import/startup cost per rebuild iteration,
+            # not parallelism.
+            job_dists = []
+            for spec, cache in jobs:
+                job_dist = BASE_DIR / "build" / "jobs" / spec.stem / "dist"
+                job_work = BASE_DIR / "build" / "jobs" / spec.stem / "work"
+                opts = _PYI_CLEAN_ARGS + ["--distpath", str(job_dist),
+                                          "--workpath", str(job_work)] + extra_args
+                if not _get_daemon().build(spec, opts):
+                    raise subprocess.CalledProcessError(1, [str(spec)] + opts)
+                job_dists.append(job_dist)
+            _merge_dist(job_dists)
+        elif len(jobs) > 1:
+            # Fan independent spec builds out across workers, then merge
+            with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+                futures = [executor.submit(_run_spec_job, spec, cache, extra_args)
+                           for spec, cache in jobs]
+                job_dists = [f.result() for f in futures]
+            _merge_dist(job_dists)
+        else:
+            # Single-spec path: build straight into dist/, keeping
+            # PyInstaller's own analysis cache between runs
+            os.environ.setdefault("PYINSTALLER_CONFIG_DIR", str(BASE_DIR / ".pyi-cache"))
+            cmd = _pyinstaller_cmd() + _PYI_CLEAN_ARGS + [str(spec_path)] + extra_args
+            returncode = _run_streamed(cmd)
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, cmd)
         print("✅ Build completed successfully")
-        
+
         # Check if the executable was created
         if expected_output.exists():
             file_size = expected_output.stat().st_size / (1024 * 1024)  # MB
             print(f"📦 Executable created: {expected_output} ({file_size:.1f} MB)")
             
-            # Make executable (for Unix systems)
+            # Make executables and bundled libraries runnable (Unix)
             if system in ["Darwin", "Linux"]:
-                os.chmod(expected_output, 0o755)
+                _chmod_tree(BASE_DIR / "dist", 0o755)
                 print("🔐 Set executable permissions")
             
             return True
@@ -158,41 +661,63 @@ def build_executable():
 
     except subprocess.CalledProcessError as e:
         print(f"❌ Build failed: {e}")
-        print(f"stdout: {e.stdout}")
-        print(f"stderr: {e.stderr}")
+        print(f"Full log: {BASE_DIR / 'build' / 'build.log'}")
         return False
 
 def build_executable_fallback():
-    """Fallback build without spec using PyInstaller CLI flags."""
+    """
+    Fallback build without spec using PyInstaller CLI flags.
+
+    Set WEB_WHISPER_DEV=1 for iteration builds: it swaps --onefile for
+    --onedir --noupx, skipping the archive compression/self-extract
+    cycle that dominates PyInstaller wall time.
+    """
     print("🔧 Using fallback PyInstaller CLI configuration")
     system = platform.system()
+    dev_build = os.environ.get("WEB_WHISPER_DEV") == "1"
     sep = ';' if system == 'Windows' else ':'
     add_data = [
         f"{(BASE_DIR / 'configs')}{sep}configs",
         f"{(BASE_DIR / 'scripts')}{sep}scripts",
     ]
-    cmd = [
-        "pyinstaller",
-        "--clean",
-        "--onefile",
+    cmd = _pyinstaller_cmd() + _PYI_CLEAN_ARGS + [
         "--name", "whisper-gui-core",
-        "--hidden-import", "mlx_whisper",
         "--hidden-import", "gradio",
         "--hidden-import", "safehttpx",
-        # Collect resources for common packages
-        "--collect-all", "mlx_whisper",
-        "--collect-all", "gradio",
         "--collect-data", "gradio_client",
         "--collect-data", "groovy",
     ]
+    # Collect submodules and data only for packages that are actually
+    # installed on this platform: --collect-all drags in every binary
+    # and resource of a package whether main.py can import it or not
+    backend_pkgs = [pkg for pkg in ("mlx_whisper", "faster_whisper")
+                    if importlib.util.find_spec(pkg) is not None]
+    for pkg in ["gradio"] + backend_pkgs:
+        cmd.extend(["--collect-submodules", pkg, "--collect-data", pkg])
+    for pkg in backend_pkgs:
+        cmd.extend(["--hidden-import", pkg])
+    if dev_build:
+        print("⚡ Dev build: --onedir --noupx (no archive pack/compress step)")
+        cmd.extend(["--onedir", "--noupx"])
+        # None of these are used by the sidecar
+        for unused in ["tkinter", "test", "unittest", "pydoc_data"]:
+            cmd.extend(["--exclude-module", unused])
+    else:
+        cmd.append("--onefile")
     for d in add_data:
         cmd.extend(["--add-data", d])
     cmd.append(str(BASE_DIR / "main.py"))
 
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        returncode = _run_streamed(cmd)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
         print("✅ Fallback build completed successfully")
-        expected_output = BASE_DIR / ("dist/whisper-gui-core.exe" if system == "Windows" else "dist/whisper-gui-core")
+        exe_name = "whisper-gui-core.exe" if system == "Windows" else "whisper-gui-core"
+        if dev_build:
+            expected_output = BASE_DIR / "dist" / "whisper-gui-core" / exe_name
+        else:
+            expected_output = BASE_DIR / "dist" / exe_name
         if expected_output.exists():
             size_mb = expected_output.stat().st_size / (1024 * 1024)
             print(f"📦 Executable created: {expected_output} ({size_mb:.1f} MB)")
@@ -202,42 +727,65 @@ def build_executable_fallback():
             return False
     except subprocess.CalledProcessError as e:
         print(f"❌ Fallback build failed: {e}")
-        print(f"stdout: {e.stdout}")
-        print(f"stderr: {e.stderr}")
+        print(f"Full log: {BASE_DIR / 'build' / 'build.log'}")
         return False
 
-def test_executable():
-    """Test the built executable."""
+async def test_executable_async():
+    """Test the built executable without blocking other post-build work."""
     system = platform.system()
     executable = BASE_DIR / ("dist/whisper-gui-core.exe" if system == "Windows" else "dist/whisper-gui-core")
-    
+
     if not executable.exists():
         print(f"❌ Executable not found: {executable}")
-    return False
-    
+        return False
+
     print("🧪 Testing executable...")
-    
+
     try:
         # Test with --help flag
-        result = subprocess.run([str(executable), "--help"], 
-                              capture_output=True, text=True, timeout=30)
-        
-        if result.returncode == 0:
+        proc = await asyncio.create_subprocess_exec(
+            str(executable), "--help",
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            print("⚠️  Executable test timed out (this may be normal)")
+            return True
+
+        if proc.returncode == 0:
             print("✅ Executable test passed")
             return True
         else:
-            print(f"⚠️  Executable test returned code {result.returncode}")
-            print(f"stdout: {result.stdout}")
-            print(f"stderr: {result.stderr}")
+            print(f"⚠️  Executable test returned code {proc.returncode}")
+            print(f"stdout: {stdout.decode(errors='replace')}")
+            print(f"stderr: {stderr.decode(errors='replace')}")
             return False
-            
-    except subprocess.TimeoutExpired:
-        print("⚠️  Executable test timed out (this may be normal)")
-        return True
+
     except Exception as e:
         print(f"❌ Executable test failed: {e}")
         return False
 
+def test_executable():
+    """Synchronous wrapper kept for direct callers."""
+    return asyncio.run(test_executable_async())
+
+def _prune_intermediates():
+    """Drop per-arch and per-spec intermediate outputs left after merging."""
+    for leftover in [BASE_DIR / "dist" / "arm64",
+                     BASE_DIR / "dist" / "x86_64",
+                     BASE_DIR / "build" / "jobs"]:
+        if leftover.exists():
+            shutil.rmtree(leftover, ignore_errors=True)
+
+async def _post_build():
+    """Run the smoke test concurrently with intermediate cleanup."""
+    test_ok, _ = await asyncio.gather(
+        test_executable_async(),
+        asyncio.to_thread(_prune_intermediates))
+    return test_ok
+
 def restore_main_py():
     """Restore the original main.py from backup."""
     main_py_path = Path("main.py")
@@ -249,20 +797,30 @@ def restore_main_py():
 
 def main():
     """Main build process."""
+    parser = argparse.ArgumentParser(description="Build the whisper-gui-core sidecar executable")
+    parser.add_argument("--force-clean", action="store_true",
+                        help="Remove build/ and dist/ even when build inputs are unchanged")
+    parser.add_argument("--strict", action="store_true",
+                        help="Abort the build on the first error line instead of running to completion")
+    args = parser.parse_args()
+
+    global STRICT_MODE
+    STRICT_MODE = args.strict
+
     print("🚀 Starting whisper-gui-core sidecar build process")
     print(f"Platform: {platform.system()} {platform.machine()}")
-    
+
     # Change to the script directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
     os.chdir(script_dir)
-    
+
     try:
         # Step 1: Check requirements
         if not check_requirements():
             sys.exit(1)
-        
+
         # Step 2: Clean build directories
-        clean_build_dirs()
+        clean_build_dirs(force_clean=args.force_clean)
         
         # Step 3: Patch main.py (optional)
         patch_main_py()
@@ -271,8 +829,8 @@ def main():
         if not build_executable():
             sys.exit(1)
         
-        # Step 5: Test executable
-        test_executable()
+        # Step 5: Test executable, overlapped with intermediate cleanup
+        asyncio.run(_post_build())
         
         print("🎉 Build process completed successfully!")
         print("\nNext steps:")
@@ -6,15 +6,32 @@ Cross-platform Whisper GUI with automatic GPU detection.
 - Linux/Other: faster-whisper with auto-detection
 """
 
+from __future__ import annotations
+
+import io
 import os
 import sys
+import functools
 import platform
 import argparse
+import atexit
 import tempfile
 import shutil
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Probe results survive restarts here so warm starts skip the
+# 5-second-timeout ffmpeg subprocess entirely
+_FFMPEG_CACHE = Path.home() / ".cache" / "web-whisper" / "ffmpeg.json"
+
+# Created once at import; the save path was stat+mkdir'ing per request
+OUTPUT_DIR = Path("outputs")
+OUTPUT_DIR.mkdir(exist_ok=True)
+
 # Ensure FFmpeg is in PATH
+@functools.lru_cache(maxsize=1)
 def setup_ffmpeg_path():
     """Add common FFmpeg installation paths to PATH."""
     current_path = os.environ.get('PATH', '')
@@ -52,14 +69,36 @@ def setup_ffmpeg_path():
 setup_ffmpeg_path()
 
 # Test FFmpeg availability
+@functools.lru_cache(maxsize=1)
 def test_ffmpeg():
-    """Test if FFmpeg is available."""
+    """Test if FFmpeg is available, reusing a cached probe when valid."""
+    import json
+
+    # Trust the cached result as long as the recorded binary still exists
+    try:
+        cached = json.loads(_FFMPEG_CACHE.read_text())
+        if cached.get("path") and os.path.exists(cached["path"]):
+            print("✅ FFmpeg is available (cached)")
+            return True
+    except (OSError, ValueError):
+        pass
+
     try:
         import subprocess
-        result = subprocess.run(['ffmpeg', '-version'], 
+        result = subprocess.run(['ffmpeg', '-version'],
                               capture_output=True, text=True, timeout=5)
         if result.returncode == 0:
             print("✅ FFmpeg is available")
+            try:
+                _FFMPEG_CACHE.parent.mkdir(parents=True, exist_ok=True)
+                tmp_cache = _FFMPEG_CACHE.with_suffix(".tmp")
+                tmp_cache.write_text(json.dumps({
+                    "path": shutil.which("ffmpeg"),
+                    "version": result.stdout.splitlines()[0] if result.stdout else ""
+                }))
+                os.replace(tmp_cache, _FFMPEG_CACHE)
+            except OSError:
+                pass
             return True
         else:
             print("❌ FFmpeg test failed")
@@ -71,56 +110,296 @@ def test_ffmpeg():
 # Test FFmpeg on startup
 test_ffmpeg()
 
-import gradio as gr
-import numpy as np
-from typing import Optional, Tuple
+# gradio, numpy and patch_gpu are imported lazily below: together they
+# account for most of the multi-second cold start, and none of them is
+# needed for --help or before the first real call
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple
 
-# Import platform-specific GPU detection
-from patch_gpu import auto_engine_detailed, auto_engine, get_available_models
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import orjson  # 3-5x faster than stdlib json for big timestamp payloads
+except ImportError:
+    orjson = None
+
+_engine_lock = threading.Lock()
+
+# Quantization for the faster-whisper backend, set from --compute-type.
+# "auto" picks int8_float16 on CUDA / int8 on CPU: INT8 weights halve
+# VRAM (large-v3 ~3 GB instead of ~6 GB) and speed up the memory-bound
+# encoder via INT8 GEMM kernels.
+_compute_type = "auto"
+
+@functools.lru_cache(maxsize=1)
+def _get_available_models():
+    """Cached model registry; the platform probe behind it runs once."""
+    from patch_gpu import get_available_models
+    return get_available_models()
+
+@functools.lru_cache(maxsize=None)
+def _load_engine(model_choice, compute_type):
+    from patch_gpu import auto_engine_detailed
+    return auto_engine_detailed(model_choice, compute_type=compute_type)
 
 def get_transcription_engine(model_choice="🎯 High Accuracy"):
-    """Initialize the appropriate transcription engine based on platform and model."""
+    """
+    Get the transcription engine for the selected model.
+
+    Engines are loaded once per model and cached for the process
+    lifetime, so repeat requests reuse the already-initialized model
+    instead of paying the weights-load/GPU-alloc cost per click. The
+    lock keeps concurrent Gradio requests from double-loading.
+    """
     try:
-        return auto_engine_detailed(model_choice)
+        with _engine_lock:
+            return _load_engine(model_choice, _compute_type)
     except Exception as e:
         print(f"Error initializing transcription engine: {e}")
         sys.exit(1)
 
-# Default transcription engine - will be updated when model is selected
-transcription_engine = get_transcription_engine()
+@functools.lru_cache(maxsize=1)
+def _i16_kernel():
+    """
+    Return a JIT-compiled float32->int16 converter, or None when numba
+    is not installed.
+
+    The kernel fuses clip+scale+cast into a single parallel pass over
+    the samples instead of numpy's three temporaries; cache=True keeps
+    the compiled code on disk so only the very first run pays the JIT.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+    import numpy as np
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def f32_to_i16(x):
+        out = np.empty(x.size, np.int16)
+        for i in prange(x.size):
+            v = x[i] * 32767.0
+            if v > 32767.0:
+                v = 32767.0
+            elif v < -32768.0:
+                v = -32768.0
+            out[i] = np.int16(v)
+        return out
+
+    return f32_to_i16
+
+def _prewarm_engine(model_choice="🎯 High Accuracy"):
+    """
+    Run one inference over a second of silence so first-use costs -
+    Metal/CUDA kernel compilation, CTranslate2 graph build and layer
+    allocation - are paid before the first real request arrives.
+    """
+    import numpy as np
+    try:
+        engine = get_transcription_engine(model_choice)
+        engine(np.zeros(16000, dtype=np.float32),
+               language="en", word_timestamps=False)
+        print("🔥 Engine prewarmed")
+    except Exception as e:
+        print(f"Engine prewarm skipped: {e}")
+
+def _write_wav(path, sample_rate, audio_data):
+    """
+    Write microphone audio as 16-bit PCM with the stdlib wave module.
+
+    A single writeframesraw through a 1 MiB buffered writer replaces the
+    scipy.io.wavfile dependency (a ~200 ms import on cold start) and its
+    per-chunk writes.
+    """
+    import numpy as np
+
+    if audio_data.dtype != np.int16:
+        # Gradio delivers float arrays in [-1, 1]
+        kernel = _i16_kernel()
+        if kernel is not None and audio_data.dtype == np.float32:
+            shape = audio_data.shape
+            audio_data = kernel(np.ascontiguousarray(audio_data).ravel()).reshape(shape)
+        else:
+            audio_data = (np.clip(audio_data, -1.0, 1.0) * 32767).astype(np.int16, copy=False)
+    channels = audio_data.shape[1] if audio_data.ndim > 1 else 1
+    with wave.open(io.BufferedWriter(open(path, 'wb'), 1 << 20), 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframesraw(np.ascontiguousarray(audio_data).tobytes())
+
+def _extract_timestamps(segments):
+    """
+    Build the serializable per-segment timestamp structure.
+
+    Whether words arrive as objects (faster-whisper) or dicts (MLX) is
+    detected once per call, so the per-word loop runs a specialized
+    comprehension instead of hasattr/.get branches on every word.
+    """
+    timestamps_data = []
+    words_are_objects = None
+    for segment in segments:
+        segment_data = {
+            "start": segment["start"],
+            "end": segment["end"],
+            "text": segment["text"].strip()
+        }
+        words = segment.get("words")
+        if words:
+            if words_are_objects is None:
+                words_are_objects = hasattr(words[0], 'start')
+            if words_are_objects:
+                segment_data["words"] = [
+                    {"start": word.start, "end": word.end, "word": word.word}
+                    for word in words
+                ]
+            else:
+                segment_data["words"] = [
+                    {"start": word.get('start', 0), "end": word.get('end', 0),
+                     "word": word.get('word', '')}
+                    for word in words
+                ]
+        timestamps_data.append(segment_data)
+    return timestamps_data
+
+def _dump_timestamps(timestamps_data):
+    """
+    Serialize timestamp data to indented JSON, via orjson when present.
+
+    Returns (text, utf-8 bytes): the text goes to the UI, the bytes go
+    to the file writer as-is, so hour-long word-level payloads are never
+    encoded twice.
+    """
+    if orjson is not None:
+        raw = orjson.dumps(timestamps_data, option=orjson.OPT_INDENT_2)
+        return raw.decode(), raw
+    import json
+    text = json.dumps(timestamps_data, indent=2, ensure_ascii=False)
+    return text, text.encode("utf-8")
+
+def _prepare_mic_audio(sample_rate, audio_data):
+    """
+    Convert Gradio microphone input to the mono float32 16 kHz ndarray
+    both whisper backends accept directly - no WAV encode, no disk
+    round-trip, no ffmpeg subprocess to re-decode it.
+
+    Returns None when in-process resampling is unavailable so the
+    caller can fall back to the temp-WAV path.
+    """
+    import numpy as np
+
+    audio = np.asarray(audio_data)
+    # Scale before downmixing: mean() promotes integer samples to
+    # float64, so checking the dtype afterwards would skip the /32768
+    # normalization for stereo input and feed full-range samples to the
+    # model
+    if np.issubdtype(audio.dtype, np.integer):
+        audio = audio.astype(np.float32) / 32768.0
+    else:
+        audio = audio.astype(np.float32, copy=False)
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    if sample_rate != 16000:
+        try:
+            from scipy.signal import resample_poly
+        except ImportError:
+            return None
+        audio = resample_poly(audio, 16000, sample_rate).astype(np.float32, copy=False)
+    return audio
+
+# Reused per-session scratch WAV for the microphone fallback path: one
+# inode that stays hot in page cache instead of a fresh
+# NamedTemporaryFile allocated and unlinked per request
+_MIC_TMP = Path(tempfile.gettempdir()) / f"web_whisper_mic_{os.getpid()}.wav"
+atexit.register(lambda: _MIC_TMP.unlink(missing_ok=True))
+
+# Output files are written off the request thread so the response
+# returns as soon as the strings are ready; two workers is plenty for
+# a txt + timestamps pair per request
+_SAVE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="wh-save")
+atexit.register(_SAVE_POOL.shutdown)
+
+def _atomic_write(path, content):
+    """Write via a temp file + os.replace so readers never see a partial file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    if isinstance(content, bytes):
+        tmp_path.write_bytes(content)
+    else:
+        tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+# Timestamp writers keyed by the (already lowercased) output format:
+# one dict lookup in the save path instead of a branch chain
+_TIMESTAMP_WRITERS = {
+    "json": lambda path, data, raw: _atomic_write(path, raw),
+    "srt": lambda path, data, raw: _atomic_write(path, convert_to_srt(data)),
+}
+_TIMESTAMP_SUFFIX = {"json": "_timestamps.json", "srt": ".srt"}
+
+def _write_outputs(output_dir, base_filename, transcription_text,
+                   timestamps_bytes, timestamps_data, fmt):
+    """Persist transcription and timestamps; runs on _SAVE_POOL."""
+    try:
+        _atomic_write(output_dir / f"{base_filename}.txt", transcription_text)
+        _TIMESTAMP_WRITERS[fmt](
+            output_dir / f"{base_filename}{_TIMESTAMP_SUFFIX[fmt]}",
+            timestamps_data, timestamps_bytes)
+        print(f"Output saved to {output_dir}/{base_filename}.txt")
+    except Exception as e:
+        print(f"Error saving output: {e}")
 
 def transcribe_audio(
     audio_file: Optional[str] = None,
     microphone_audio: Optional[Tuple[int, np.ndarray]] = None,
     language: str = "auto",
     word_timestamps: bool = True,
+    vad_filter: bool = True,
+    batch_size: int = 8,
     save_output: bool = True,
     output_format: str = "json",
     model_choice: str = "🎯 High Accuracy"
-) -> Tuple[str, str, str]:
+) -> Iterator[Tuple[str, str, str]]:
     """
     Transcribe audio using the platform-optimized engine.
-    
-    Returns:
-        - transcription_text: Plain text transcription
-        - timestamps_json: JSON with detailed timestamps
+
+    Implemented as a generator so Gradio streams decoded text to the
+    browser segment by segment instead of blocking until the whole file
+    is done.
+
+    Yields:
+        - transcription_text: Plain text transcription (grows per segment)
+        - timestamps_json: JSON with detailed timestamps (final yield)
         - info_text: Processing information
     """
-    
-    # Handle audio input
+
+    # Normalize the timestamp format once; unknown values fall back to
+    # json rather than silently dropping the timestamps file
+    fmt = output_format.lower()
+    if fmt not in _TIMESTAMP_WRITERS:
+        fmt = "json"
+
+    # Handle audio input; base_filename and input_info are derived once
+    # here and reused by both the info panel and the save path
     if audio_file is not None:
         audio_path = audio_file
+        input_name = Path(audio_file).name
+        base_filename = Path(audio_file).stem
+        input_info = f"Input: {input_name}"
     elif microphone_audio is not None:
-        # Save microphone input to temp file
+        # Feed the microphone samples straight to the model when possible
         sample_rate, audio_data = microphone_audio
-        temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        
-        # Convert numpy array to audio file
-        import scipy.io.wavfile
-        scipy.io.wavfile.write(temp_file.name, sample_rate, audio_data)
-        audio_path = temp_file.name
+        audio_np = _prepare_mic_audio(sample_rate, audio_data)
+        if audio_np is not None:
+            audio_path = audio_np
+        else:
+            # Fallback: rewrite the per-session scratch WAV
+            _write_wav(str(_MIC_TMP), sample_rate, audio_data)
+            audio_path = str(_MIC_TMP)
+        base_filename = "microphone"
+        input_info = "Input: Microphone recording"
     else:
-        return "No audio input provided", "", ""
+        yield "No audio input provided", "", ""
+        return
     
     try:
         # Get the appropriate engine for the selected model
@@ -131,121 +410,72 @@ def transcribe_audio(
         result = current_engine(
             audio_path,
             language=language_param,
-            word_timestamps=word_timestamps
+            word_timestamps=word_timestamps,
+            vad_filter=vad_filter,
+            batch_size=batch_size
         )
         
+        # Stream decoded text to the UI as segments arrive; the engine
+        # may hand us a materialized list or a lazy segment iterator
+        text_parts = []
+        if isinstance(result, dict) and result.get("segments"):
+            streamed_segments = []
+            for segment in result["segments"]:
+                streamed_segments.append(segment)
+                text_parts.append(segment["text"])
+                yield "".join(text_parts), "", "⏳ Transcribing..."
+            result["segments"] = streamed_segments
+
         # Extract results
-        transcription_text = result.get("text", "")
-        
+        transcription_text = result.get("text", "") or "".join(text_parts)
+
         # Format timestamps
         if "segments" in result and result["segments"]:
-            timestamps_data = []
-            for segment in result["segments"]:
-                segment_data = {
-                    "start": segment["start"],
-                    "end": segment["end"],
-                    "text": segment["text"].strip()
-                }
-                if "words" in segment and segment["words"]:
-                    segment_data["words"] = [
-                        {
-                            "start": word.start if hasattr(word, 'start') else word.get('start', 0),
-                            "end": word.end if hasattr(word, 'end') else word.get('end', 0),
-                            "word": word.word if hasattr(word, 'word') else word.get('word', '')
-                        }
-                        for word in segment["words"]
-                    ]
-                timestamps_data.append(segment_data)
-            
-            import json
-            timestamps_json = json.dumps(timestamps_data, indent=2, ensure_ascii=False)
+            timestamps_data = _extract_timestamps(result["segments"])
+            timestamps_json, timestamps_bytes = _dump_timestamps(timestamps_data)
         else:
+            timestamps_data = []
             timestamps_json = "No timestamp data available"
+            timestamps_bytes = timestamps_json.encode("utf-8")
         
         # Processing info
         detected_lang = result.get("language", "unknown")
         lang_prob = result.get("language_probability", 0.0)
-        
-        # Get base filename for info display
-        if audio_file is not None:
-            base_filename = Path(audio_file).stem
-            input_info = f"Input: {Path(audio_file).name}"
-        elif 'temp_file' in locals() and temp_file:
-            base_filename = Path(temp_file.name).stem
-            input_info = "Input: Microphone recording"
-        else:
-            base_filename = "transcription"
-            input_info = "Input: Unknown source"
-        
+
         info_text = f"{input_info}\nDetected language: {detected_lang} (confidence: {lang_prob:.2f})\nOutput file: {base_filename}.txt"
         
-        # Save output if requested
+        # Save output if requested; the writes run on _SAVE_POOL so the
+        # response isn't held back by disk I/O
         if save_output:
-            output_dir = Path("outputs")
-            output_dir.mkdir(exist_ok=True)
-            
-            # Get base filename from input file
-            if audio_file is not None:
-                base_filename = Path(audio_file).stem
-            elif 'temp_file' in locals() and temp_file:
-                # Extract original name from temp file
-                base_filename = Path(temp_file.name).stem
-            else:
-                base_filename = "transcription"
-            
-            # Save transcription with original filename
-            transcription_file = f"{base_filename}.txt"
-            with open(output_dir / transcription_file, "w", encoding="utf-8") as f:
-                f.write(transcription_text)
-            
-            # Save timestamps with original filename
-            if output_format.lower() == "json":
-                timestamps_file = f"{base_filename}_timestamps.json"
-                with open(output_dir / timestamps_file, "w", encoding="utf-8") as f:
-                    f.write(timestamps_json)
-            elif output_format.lower() == "srt":
-                timestamps_file = f"{base_filename}.srt"
-                srt_content = convert_to_srt(timestamps_data if 'timestamps_data' in locals() else [])
-                with open(output_dir / timestamps_file, "w", encoding="utf-8") as f:
-                    f.write(srt_content)
-            
-            print(f"Output saved to {output_dir}/{transcription_file}")
-        
-        return transcription_text, timestamps_json, info_text
-        
+            _SAVE_POOL.submit(_write_outputs, OUTPUT_DIR, base_filename,
+                              transcription_text, timestamps_bytes,
+                              timestamps_data, fmt)
+
+        yield transcription_text, timestamps_json, info_text
+
     except Exception as e:
         error_msg = f"Transcription error: {str(e)}"
         print(error_msg)
-        return error_msg, "", error_msg
-    
-    finally:
-        # Clean up temp file if created
-        if 'temp_file' in locals():
-            try:
-                os.unlink(temp_file.name)
-            except:
-                pass
+        yield error_msg, "", error_msg
 
 def convert_to_srt(segments_data):
     """Convert timestamp data to SRT format."""
-    srt_content = ""
+    # Collect entries in a list and join once: += on a string is
+    # quadratic in the total output size
+    parts = []
     for i, segment in enumerate(segments_data, 1):
         start_time = format_srt_time(segment["start"])
         end_time = format_srt_time(segment["end"])
         text = segment["text"].strip()
-        
-        srt_content += f"{i}\n"
-        srt_content += f"{start_time} --> {end_time}\n"
-        srt_content += f"{text}\n\n"
-    
-    return srt_content
+        parts.append(f"{i}\n{start_time} --> {end_time}\n{text}\n\n")
+
+    return "".join(parts)
 
 def format_srt_time(seconds):
     """Format seconds to SRT time format (HH:MM:SS,mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millisecs = int((seconds % 1) * 1000)
+    hours, rem = divmod(int(seconds * 1000), 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    secs, millisecs = divmod(rem, 1000)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
 
 # Detect system info for UI
@@ -253,9 +483,15 @@ def get_system_info():
     """Get system information for display."""
     system = platform.system()
     machine = platform.machine()
-    
+
     if system == "Darwin" and machine.startswith("arm"):
-        backend_info = "🍎 Apple Silicon (MLX + Metal GPU)"
+        # Verify the MLX backend actually loads rather than assuming:
+        # this is what auto_engine_detailed will route to on this machine
+        try:
+            import mlx.core  # noqa: F401
+            backend_info = "🍎 Apple Silicon (MLX + Metal GPU)"
+        except ImportError:
+            backend_info = "🍎 Apple Silicon (MLX not installed - CPU fallback)"
     elif system == "Windows":
         backend_info = "🪟 Windows (faster-whisper + CUDA)"
     elif system == "Darwin":
@@ -267,8 +503,10 @@ def get_system_info():
 
 # Create Gradio interface
 def create_interface():
+    import gradio as gr
+
     system_info = get_system_info()
-    
+
     with gr.Blocks(
         title="Web Whisper - Cross-platform Speech to Text",
         theme=gr.themes.Soft()
@@ -304,7 +542,7 @@ def create_interface():
                 with gr.Group():
                     gr.Markdown("### ⚙️ Options")
                     model_choice = gr.Dropdown(
-                        choices=list(get_available_models().keys()),
+                        choices=list(_get_available_models().keys()),
                         value="🎯 High Accuracy",
                         label="Model Selection",
                         info="Choose model based on accuracy vs speed preference"
@@ -322,7 +560,23 @@ def create_interface():
                         label="Word-level timestamps",
                         info="Generate detailed word-level timing information"
                     )
-                    
+
+                    vad_filter = gr.Checkbox(
+                        value=True,
+                        label="Skip silence (VAD)",
+                        info="Strip silent regions before transcription - faster and fewer hallucinations"
+                    )
+
+                    batch_size = gr.Slider(
+                        minimum=1,
+                        maximum=32,
+                        value=8,
+                        step=1,
+                        label="Batch size",
+                        info="GPU batch size for long files (CUDA only)"
+                    )
+
+
                     save_output = gr.Checkbox(
                         value=True,
                         label="Save output files",
@@ -373,9 +627,11 @@ def create_interface():
             fn=transcribe_audio,
             inputs=[
                 audio_file,
-                microphone, 
+                microphone,
                 language,
                 word_timestamps,
+                vad_filter,
+                batch_size,
                 save_output,
                 output_format,
                 model_choice
@@ -390,9 +646,9 @@ def create_interface():
         # Add examples
         gr.Examples(
             examples=[
-                ["examples/coffe_break_example.mp3", "auto", True, True, "json", "🎯 High Accuracy"]
+                ["examples/coffe_break_example.mp3", "auto", True, True, 8, True, "json", "🎯 High Accuracy"]
             ] if Path("examples/coffe_break_example.mp3").exists() else [],
-            inputs=[audio_file, language, word_timestamps, save_output, output_format, model_choice],
+            inputs=[audio_file, language, word_timestamps, vad_filter, batch_size, save_output, output_format, model_choice],
             outputs=[transcription_output, timestamps_output, info_output],
             fn=transcribe_audio,
             cache_examples=False
@@ -425,18 +681,33 @@ def main():
     )
     
     parser.add_argument(
-        "--server.port", 
+        "--server.port",
         dest="server_port",
         type=int,
         default=7860,
         help="Server port"
     )
-    
+
+    parser.add_argument(
+        "--compute-type",
+        choices=["auto", "int8", "int8_float16", "float16", "float32"],
+        default="auto",
+        help="faster-whisper quantization (auto = int8_float16 on CUDA, int8 on CPU; "
+             "int8 variants halve VRAM at near-identical accuracy)"
+    )
+
+    parser.add_argument(
+        "--preload-models",
+        action="store_true",
+        default=False,
+        help="Load every available model at startup instead of only the default"
+    )
+
     args = parser.parse_args()
-    
-    # Create output directory
-    Path("outputs").mkdir(exist_ok=True)
-    
+
+    global _compute_type
+    _compute_type = args.compute_type
+
     # Check if running in Docker
     is_docker = os.path.exists('/.dockerenv')
     server_name = "0.0.0.0" if is_docker else args.server_name
@@ -444,15 +715,52 @@ def main():
     print(f"🚀 Starting Web Whisper server on {server_name}:{args.server_port}")
     print(f"🎯 Backend: {get_system_info()}")
     
+    # Populate the model registry cache while the interface builds
+    threading.Thread(target=_get_available_models, daemon=True).start()
+
+    # Warm the engine cache so the first click doesn't pay the model load
+    if args.preload_models:
+        for model in _get_available_models():
+            get_transcription_engine(model)
+    else:
+        get_transcription_engine()
+
     # Create and launch interface
     demo = create_interface()
-    
-    demo.launch(
-        server_name=server_name,
-        server_port=args.server_port,
-        inbrowser=args.autolaunch,
-        share=args.share
-    )
+
+    # First inference compiles GPU kernels; run it on silence in the
+    # background so the UI opens while the warmup happens
+    threading.Thread(target=_prewarm_engine, daemon=True).start()
+
+    # Let two requests move through the queue at once so the GPU isn't
+    # idle while one response is being serialized/sent
+    demo.queue(default_concurrency_limit=2)
+
+    try:
+        import uvicorn
+        from fastapi import FastAPI
+        from fastapi.middleware.gzip import GZipMiddleware
+    except ImportError:
+        uvicorn = None
+
+    if uvicorn is None or args.share or args.autolaunch:
+        # share links and browser auto-open are demo.launch features;
+        # keep the stock Gradio server for those (and when fastapi or
+        # uvicorn isn't installed)
+        demo.launch(
+            server_name=server_name,
+            server_port=args.server_port,
+            inbrowser=args.autolaunch,
+            share=args.share
+        )
+        return
+
+    import gradio as gr
+    app = FastAPI()
+    # Word-level timestamp JSON is text-heavy and compresses 5-10x
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+    app = gr.mount_gradio_app(app, demo, path="/")
+    uvicorn.run(app, host=server_name, port=args.server_port)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
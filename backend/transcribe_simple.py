@@ -8,71 +8,162 @@ import argparse
 from pathlib import Path
 from patch_gpu import auto_engine_detailed
 
-def transcribe_file(file_path: str, language: str = "auto", output_format: str = "text"):
-    """Transcribe an audio file and return the result."""
-    try:
-        # Initialize the transcription engine (suppress GPU messages)
+# One engine per process: --serve mode and repeated transcribe_file
+# calls reuse the loaded model instead of paying platform detection and
+# the multi-GB weights load per transcription
+_engine = None
+
+def _get_engine():
+    """Initialize the engine once, routing its chatter to stderr."""
+    global _engine
+    if _engine is None:
         print(f"Loading transcription engine...", file=sys.stderr)
-        
+
         # Capture GPU info messages to stderr to avoid mixing with transcription result
         import io
         from contextlib import redirect_stdout, redirect_stderr
-        
+
         gpu_output = io.StringIO()
         with redirect_stdout(gpu_output), redirect_stderr(gpu_output):
-            engine = auto_engine_detailed()
-        
+            _engine = auto_engine_detailed()
+
         # Print GPU info to stderr only
         gpu_messages = gpu_output.getvalue()
         if gpu_messages:
             print(gpu_messages.strip(), file=sys.stderr)
-        
-        print(f"Transcribing: {file_path}", file=sys.stderr)
-        
-        # Call the transcription function
-        print(f"Engine type: {type(engine)}", file=sys.stderr)
-        print(f"Engine methods: {[attr for attr in dir(engine) if 'transcribe' in attr.lower()]}", file=sys.stderr)
-        
-        # Try different transcription methods
+    return _engine
+
+_transcribe_fn = None
+
+def _get_transcribe_fn():
+    """
+    Resolve the engine's dispatch style once and bind a callable.
+
+    The callable/hasattr probing (and the dir() listings that used to be
+    printed for debugging) ran on every transcription; the engine's shape
+    can't change after load, so decide once and cache the bound function.
+    """
+    global _transcribe_fn
+    if _transcribe_fn is None:
+        engine = _get_engine()
         if callable(engine):
-            # Function returned by auto_engine_detailed
-            result = engine(file_path, language=language if language != "auto" else None)
-            if isinstance(result, dict):
-                return result.get('text', '').strip()
-            else:
+            # Function returned by auto_engine_detailed; VAD strips
+            # silence before the encoder runs
+            def fn(path, language):
+                result = engine(path, language=language, vad_filter=True)
+                if isinstance(result, dict):
+                    text = result.get('text', '').strip()
+                    if not text and result.get('segments') is not None:
+                        # Lazy-segment engines leave text empty and
+                        # stream the segments; drain them here
+                        text = "".join(seg.get('text', '')
+                                       for seg in result['segments']).strip()
+                    return text
                 return str(result).strip()
         elif hasattr(engine, 'transcribe'):
             # MLX backend
-            result = engine.transcribe(file_path, language=language if language != "auto" else None)
-            if isinstance(result, dict):
-                return result.get('text', result.get('segments', str(result)))
-            else:
+            def fn(path, language):
+                result = engine.transcribe(path, language=language)
+                if isinstance(result, dict):
+                    return result.get('text', result.get('segments', str(result)))
                 return str(result)
         elif hasattr(engine, 'transcribe_audio'):
             # faster-whisper backend
-            segments, info = engine.transcribe_audio(file_path, language=language if language != "auto" else None)
-            text = ' '.join(segment.text for segment in segments)
-            return text
+            def fn(path, language):
+                segments, info = engine.transcribe_audio(path, language=language)
+                return ' '.join(segment.text for segment in segments)
         else:
-            available_methods = [attr for attr in dir(engine) if not attr.startswith('_')]
-            return f"Error: Unknown engine type. Available methods: {available_methods}"
-            
+            raise TypeError(f"Unknown engine type: {type(engine)!r}")
+        _transcribe_fn = fn
+    return _transcribe_fn
+
+def transcribe_file(file_path: str, language: str = "auto", output_format: str = "text"):
+    """Transcribe an audio file and return the result."""
+    try:
+        fn = _get_transcribe_fn()
+        print(f"Transcribing: {file_path}", file=sys.stderr)
+        return fn(file_path, language if language != "auto" else None)
     except Exception as e:
         print(f"Error during transcription: {e}", file=sys.stderr)
         return f"Error: {e}"
 
+def serve():
+    """
+    Long-lived worker mode for the Tauri sidecar.
+
+    Reads one JSON request per line from stdin ({"path": ..., "language":
+    ...}) and answers with one JSON line per request. The engine loads on
+    the first request and stays resident, so repeated hotkey triggers
+    skip the multi-second cold start a subprocess per file would pay.
+
+    A reader thread keeps draining stdin while a transcription is
+    running, so rapid-fire dictation triggers queue up instead of
+    blocking the pipe; each request is handled as soon as the previous
+    one finishes.
+    """
+    import asyncio
+    import json
+    import threading
+
+    def handle(line: str):
+        """Process one JSON request line; returns the reply, or None on exit."""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return json.dumps({"error": f"Invalid request: {e}"})
+        if request.get("exit"):
+            return None
+        path = request.get("path", "")
+        if not Path(path).exists():
+            return json.dumps({"error": f"File not found: {path}"})
+        text = transcribe_file(path, request.get("language", "auto"))
+        return json.dumps({"text": text}, ensure_ascii=False)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def read_stdin():
+            for raw in sys.stdin:
+                raw = raw.strip()
+                if raw:
+                    loop.call_soon_threadsafe(queue.put_nowait, raw)
+            loop.call_soon_threadsafe(queue.put_nowait, None)  # EOF
+
+        threading.Thread(target=read_stdin, daemon=True, name="wh-stdin").start()
+
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            reply = await asyncio.to_thread(handle, item)
+            if reply is None:
+                break
+            print(reply, flush=True)
+
+    asyncio.run(run())
+
 def main():
     parser = argparse.ArgumentParser(description="Transcribe audio file")
-    parser.add_argument("file_path", help="Path to audio file")
+    parser.add_argument("file_path", nargs="?", help="Path to audio file")
     parser.add_argument("--language", default="auto", help="Language code (default: auto)")
     parser.add_argument("--format", default="text", help="Output format (default: text)")
-    
+    parser.add_argument("--serve", action="store_true",
+                        help="Run as a long-lived worker reading JSON requests from stdin")
+
     args = parser.parse_args()
-    
+
+    if args.serve:
+        serve()
+        return
+
+    if not args.file_path:
+        parser.error("file_path is required unless --serve is given")
+
     if not Path(args.file_path).exists():
         print(f"Error: File not found: {args.file_path}", file=sys.stderr)
         sys.exit(1)
-    
+
     result = transcribe_file(args.file_path, args.language, args.format)
     print(result)
 
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Long-lived PyInstaller worker process used by build_sidecar.py.
+
+Spawning a fresh `pyinstaller` process per build pays the PyInstaller
+import and modulegraph initialization cost (seconds) every time. This
+worker imports PyInstaller once, then loops reading one JSON command per
+line from stdin:
+
+    {"spec": "/path/to/file.spec", "opts": ["--distpath", "..."]}
+
+and writes one JSON response per build to stdout:
+
+    {"ok": true} or {"ok": false, "error": "..."}
+
+Send {"exit": true} (or close stdin) to shut the worker down.
+"""
+
+import json
+import sys
+
+import PyInstaller.__main__
+
+
+def main():
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        command = json.loads(line)
+        if command.get("exit"):
+            break
+        try:
+            PyInstaller.__main__.run([command["spec"], *command.get("opts", [])])
+            response = {"ok": True}
+        except SystemExit as e:
+            ok = e.code in (0, None)
+            response = {"ok": ok} if ok else {"ok": False, "error": f"exit code {e.code}"}
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        print(json.dumps(response), flush=True)
+
+
+if __name__ == "__main__":
+    main()
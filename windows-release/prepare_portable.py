@@ -22,30 +22,78 @@ Prerequisites on Windows:
 """
 
 import argparse
+import functools
+import hashlib
+import json
 import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
-import platform
 
 ROOT = Path(__file__).resolve().parents[1]
 BACKEND = ROOT / "backend"
 FRONTEND = ROOT / "frontend"
 TAURI_TARGET = FRONTEND / "src-tauri" / "target" / "x86_64-pc-windows-msvc" / "release"
 STAGE = ROOT / "windows-release" / "stage"
+STAGE_STAMP = STAGE / ".stagestamp.json"
+APPEXE_CACHE = ROOT / "windows-release" / ".appexe.cache.json"
 NSI_FILE = ROOT / "windows-release" / "portable.nsi"
 
+# Set from --verbose in main(); command echoing is opt-in so the display
+# string is only built when someone is actually reading it
+_verbose = False
+
 def run(cmd, cwd=None, check=True):
-    print("$", " ".join(map(str, cmd)))
+    if _verbose:
+        # list2cmdline quotes correctly on Windows, unlike a naive join
+        print("$", subprocess.list2cmdline([str(c) for c in cmd]))
     return subprocess.run(cmd, cwd=cwd or ROOT, check=check)
 
+def _tree_signature(*paths: Path, pattern: str = "*") -> str:
+    """
+    SHA1 over (relative path, size, mtime_ns) of every matching file.
+
+    Directories are matched recursively against pattern; individual
+    files are hashed as-is, so manifests that sit outside the source
+    trees (spec files, requirements, package.json) can be part of the
+    key. Cheap enough to run before each build; if nothing it covers has
+    changed, the minutes-long build it guards can be skipped outright.
+    """
+    h = hashlib.sha1()
+    for path in paths:
+        if path.is_dir():
+            for p in sorted(path.rglob(pattern)):
+                if p.is_file():
+                    st = p.stat()
+                    h.update(f"{p.relative_to(path)}|{st.st_size}|{st.st_mtime_ns}\n".encode())
+        elif path.is_file():
+            st = path.stat()
+            h.update(f"{path.name}|{st.st_size}|{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
 def build_backend():
     print("[1/4] Building backend sidecar (PyInstaller onefile)...")
-    run([sys.executable, str(BACKEND / "build_sidecar.py")], cwd=BACKEND)
     exe = BACKEND / "dist" / "whisper-gui-core.exe"
+    # The spec files and requirements change what PyInstaller packages
+    # even when no .py source did
+    sig = _tree_signature(BACKEND,
+                          BACKEND / "whisper-gui-core.spec",
+                          BACKEND / "whisper-gui-core-simple.spec",
+                          BACKEND / "requirements.txt",
+                          pattern="*.py")
+    sig_file = exe.parent / ".buildsig"
+    try:
+        if exe.exists() and sig_file.read_text() == sig:
+            print("Backend sources unchanged; reusing existing sidecar.")
+            return exe
+    except OSError:
+        pass
+    run([sys.executable, str(BACKEND / "build_sidecar.py")], cwd=BACKEND)
     if not exe.exists():
         raise FileNotFoundError(f"Sidecar exe not found: {exe}")
+    sig_file.write_text(sig)
     return exe
 
 def _load_product_name() -> str:
@@ -55,16 +103,45 @@ def _load_product_name() -> str:
         data = json.load(f)
     return data.get("productName", "Web Whisper")
 
+@functools.lru_cache(maxsize=1)
 def _load_binary_name() -> str:
-    """Read Cargo package name to determine exe name (e.g., web-whisper.exe)."""
-    import tomllib
+    """Read Cargo package name to determine exe name (e.g., web-whisper.exe).
+
+    Scans just the [package] table line by line - a full tomllib parse
+    of a workspace-sized Cargo.toml is overkill for one key. Falls back
+    to tomllib if the quick scan comes up empty.
+    """
     cargo = FRONTEND / "src-tauri" / "Cargo.toml"
+    in_pkg = False
+    with open(cargo, "r", encoding="utf-8") as f:
+        for line in f:
+            s = line.strip()
+            if s.startswith("[") and s.endswith("]"):
+                in_pkg = (s == "[package]")
+                continue
+            if in_pkg and s.startswith("name"):
+                key, _, value = s.partition("=")
+                if key.strip() == "name":
+                    name = value.strip().strip("\"'")
+                    return f"{name}.exe"
+
+    import tomllib
     with open(cargo, "rb") as f:
         data = tomllib.load(f)
     pkg = data.get("package", {})
     name = pkg.get("name", "web-whisper")
     return f"{name}.exe"
 
+def _remember_app_exe(app_exe: Path) -> Path:
+    """Record a discovered app exe so later runs can skip the tree walk."""
+    try:
+        st = app_exe.stat()
+        APPEXE_CACHE.write_text(json.dumps(
+            {"app_exe": str(app_exe), "sig": [st.st_size, st.st_mtime_ns]}))
+    except OSError:
+        pass  # cache is best-effort
+    return app_exe
+
 def _find_app_exe() -> tuple[Path, Path]:
     """Locate the built app exe across possible Tauri layouts.
 
@@ -73,13 +150,25 @@ def _find_app_exe() -> tuple[Path, Path]:
     2) Any exe matching productName in bundle/ (nsis/app) excluding installers
     3) Any exe under bundle/app/<ProductName>/
     """
+    # 0) Cached result from a previous run: the bundle/ rglob below walks
+    # thousands of build intermediates, so skip it while the cached exe
+    # still exists with the same size and mtime
+    try:
+        cached = json.loads(APPEXE_CACHE.read_text())
+        p = Path(cached["app_exe"])
+        st = p.stat()
+        if [st.st_size, st.st_mtime_ns] == cached.get("sig"):
+            return p.parent, p
+    except (OSError, ValueError, KeyError):
+        pass
+
     product = _load_product_name()
     binary_name = _load_binary_name()
 
     # 1) Direct release binary
     release_exe = TAURI_TARGET / binary_name
     if release_exe.exists():
-        return release_exe.parent, release_exe
+        return release_exe.parent, _remember_app_exe(release_exe)
 
     # 2) Look under bundle/ for product exe
     bundle_root = TAURI_TARGET / "bundle"
@@ -100,7 +189,7 @@ def _find_app_exe() -> tuple[Path, Path]:
 
     if candidates:
         app_exe = max(candidates, key=lambda p: p.stat().st_size)
-        return app_exe.parent, app_exe
+        return app_exe.parent, _remember_app_exe(app_exe)
 
     raise FileNotFoundError(
         f"Could not locate app exe for productName '{product}' or binary '{binary_name}' under {TAURI_TARGET}"
@@ -108,60 +197,182 @@ def _find_app_exe() -> tuple[Path, Path]:
 
 def build_frontend():
     print("[2/4] Building Tauri app (bundle)...")
+    # Version bumps and dependency changes live in the manifests, not
+    # under src/, and must invalidate the skip too
+    sig = _tree_signature(FRONTEND / "src", FRONTEND / "src-tauri" / "src",
+                          FRONTEND / "src-tauri" / "tauri.conf.json",
+                          FRONTEND / "src-tauri" / "Cargo.toml",
+                          FRONTEND / "package.json")
+    sig_file = ROOT / "windows-release" / ".frontend.buildsig"
+    try:
+        if sig_file.read_text() == sig:
+            app = _find_app_exe()
+            print("Frontend sources unchanged; reusing existing app.")
+            return app
+    except (OSError, FileNotFoundError):
+        pass
     # Build with default bundles or nsis; caller (CI) may build separately
     run(["npx", "pnpm", "tauri", "build", "--", "--target", "x86_64-pc-windows-msvc"], cwd=FRONTEND)
+    sig_file.write_text(sig)
     return _find_app_exe()
 
+def _link_or_copy(src, dst):
+    """Hardlink a file into the stage, falling back to a byte copy."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-volume, filesystem without hardlinks, etc.
+        shutil.copy2(src, dst)
+
+def _collect_tree(src: Path, dst: Path, tasks: list):
+    """
+    Pre-create the destination directories (fast, must be ordered) and
+    queue one (src, dst) task per file for the parallel copy pass.
+
+    The staged dlls/resources run to hundreds of MB, are read once by
+    makensis and never mutated, so a hardlink (a metadata operation on
+    NTFS and APFS alike) serves as well as rewriting every byte.
+    """
+    dst.mkdir(parents=True, exist_ok=True)
+    for entry in os.scandir(src):
+        target = dst / entry.name
+        if entry.is_dir(follow_symlinks=False):
+            _collect_tree(Path(entry.path), target, tasks)
+        else:
+            tasks.append((entry.path, target))
+
+def _run_copy_tasks(tasks: list):
+    """
+    Link/copy queued files in parallel.
+
+    Hundreds of small independent files dominate staging time -
+    especially under Defender scanning on Windows - so overlapping the
+    per-file syscalls buys most of the remaining wall clock.
+    """
+    if not tasks:
+        return
+    max_workers = min(32, (os.cpu_count() or 8) * 4, len(tasks))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for _ in pool.map(lambda t: _link_or_copy(*t), tasks):
+            pass
+
+def _source_manifest(app_dir: Path, app_exe: Path, sidecar_exe: Path) -> dict:
+    """
+    Fingerprint every staging input: size, mtime_ns and a SHA1 over the
+    first and last 64 KB of each file. The partial hash catches rebuilt
+    artifacts with preserved timestamps without rereading hundreds of MB.
+    """
+    entries = {}
+
+    def add(path: Path):
+        st = path.stat()
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            h.update(f.read(65536))
+            if st.st_size > 131072:
+                f.seek(-65536, os.SEEK_END)
+                h.update(f.read(65536))
+        entries[str(path)] = [st.st_size, st.st_mtime_ns, h.hexdigest()]
+
+    add(app_exe)
+    add(sidecar_exe)
+    trees = [app_dir / folder for folder in ("resources", "data", "bin")]
+    trees.append(ROOT / "windows-release" / "WebView2Runtime")
+    for tree in trees:
+        if tree.is_dir():
+            for dirpath, _, files in os.walk(tree):
+                for name in files:
+                    add(Path(dirpath) / name)
+    return entries
+
 def stage_files(app_dir: Path, app_exe: Path, sidecar_exe: Path):
     print("[3/4] Staging files for portable package...")
+
+    # Skip the whole restage when every input matches the stamp written
+    # by the previous run
+    manifest = _source_manifest(app_dir, app_exe, sidecar_exe)
+    if STAGE.exists() and STAGE_STAMP.exists():
+        try:
+            if json.loads(STAGE_STAMP.read_text()) == manifest:
+                print(f"Stage up-to-date: {STAGE}")
+                return
+        except (OSError, ValueError):
+            pass
+
     if STAGE.exists():
         shutil.rmtree(STAGE)
     STAGE.mkdir(parents=True, exist_ok=True)
 
-    # Copy Tauri app executable and nearby resources if present
-    shutil.copy2(app_exe, STAGE / app_exe.name)
-    # Copy common runtime folders if they exist (resource locations vary by bundler)
+    # Queue the Tauri app executable, the sidecar, the common runtime
+    # folders (resource locations vary by bundler) and the optional
+    # WebView2 Fixed Runtime, then copy everything in one parallel pass
+    tasks = [(app_exe, STAGE / app_exe.name),
+             (sidecar_exe, STAGE / sidecar_exe.name)]
     for folder in ("resources", "data", "bin"):
         src = app_dir / folder
         if src.exists() and src.is_dir():
-            shutil.copytree(src, STAGE / folder)
-
-    # Ensure sidecar is next to app exe
-    shutil.copy2(sidecar_exe, STAGE / sidecar_exe.name)
+            _collect_tree(src, STAGE / folder, tasks)
 
-    # Optionally include WebView2 Fixed Runtime if present
     webview2 = ROOT / "windows-release" / "WebView2Runtime"
     if webview2.exists():
         print("Including WebView2 Fixed Runtime...")
-        shutil.copytree(webview2, STAGE / "WebView2Runtime")
+        _collect_tree(webview2, STAGE / "WebView2Runtime", tasks)
 
+    _run_copy_tasks(tasks)
+
+    STAGE_STAMP.write_text(json.dumps(manifest))
     print(f"Staged at: {STAGE}")
 
 def build_portable_exe(output: str):
     print("[4/4] Building NSIS portable exe...")
     if not NSI_FILE.exists():
         raise FileNotFoundError(f"NSIS script missing: {NSI_FILE}")
+    # Skip makensis when the previous portable exe is newer than the
+    # last restage
+    out_path = NSI_FILE.parent / output
+    if (out_path.exists() and STAGE_STAMP.exists()
+            and STAGE_STAMP.stat().st_mtime <= out_path.stat().st_mtime):
+        print(f"Portable exe up-to-date: {out_path}")
+        return
     # Allow custom output name by passing /DOutFile=... to makensis
     cmd = ["makensis", f"/DOutFile={output}", str(NSI_FILE)]
     run(cmd, cwd=NSI_FILE.parent)
     print(f"Portable exe created: {NSI_FILE.parent / output}")
 
 def main():
-    if platform.system() != "Windows":
+    # sys.platform is a constant; platform.system() re-probes uname
+    if sys.platform != "win32":
         print("Warning: This script is intended to run on Windows.")
 
     p = argparse.ArgumentParser(description="Prepare Windows portable exe")
     p.add_argument("--skip-build", action="store_true", help="Skip building backend/frontend; reuse existing artifacts")
     p.add_argument("--output", default="WebWhisper-Portable.exe", help="Output portable exe name")
+    p.add_argument("--jobs", type=int, default=2, choices=(1, 2),
+                   help="2 overlaps the backend and frontend builds; 1 runs them serially")
+    p.add_argument("--verbose", action="store_true", help="Echo each command before running it")
     args = p.parse_args()
 
+    global _verbose
+    _verbose = args.verbose
+
     sidecar_exe = BACKEND / "dist" / "whisper-gui-core.exe"
     app_dir = None
     app_exe = None
 
     if not args.skip_build:
-        sidecar_exe = build_backend()
-        app_dir, app_exe = build_frontend()
+        if args.jobs > 1:
+            # PyInstaller and pnpm/cargo share no artifacts until
+            # staging, so overlap them; wall clock drops to the slower
+            # of the two. Their output may interleave - use --jobs 1
+            # when debugging a build failure
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                backend_future = ex.submit(build_backend)
+                frontend_future = ex.submit(build_frontend)
+                sidecar_exe = backend_future.result()
+                app_dir, app_exe = frontend_future.result()
+        else:
+            sidecar_exe = build_backend()
+            app_dir, app_exe = build_frontend()
     else:
         # Try to discover existing build artifacts (nsis/app agnostic)
         app_dir, app_exe = _find_app_exe()